@@ -103,6 +103,10 @@ from datahub.utilities.urns.urn_iter import lowercase_dataset_urn
 # Logger instance
 logger = logging.getLogger(__name__)
 
+# The same PowerBI users show up as owners of many dashboards, reports and
+# datasets, so the encoded corpuser urn is rebuilt far more often than it changes.
+_make_user_urn_cached = functools.lru_cache(maxsize=100_000)(builder.make_user_urn)
+
 
 class Mapper:
     """
@@ -307,8 +311,8 @@ class Mapper:
         Create corpuser urn from PowerBI (configured by| modified by| created by) user
         """
         if self.__config.ownership.remove_email_suffix:
-            return builder.make_user_urn(user.split("@")[0])
-        return builder.make_user_urn(f"users.{user}")
+            return _make_user_urn_cached(user.split("@")[0])
+        return _make_user_urn_cached(f"users.{user}")
 
     def to_datahub_schema_field(
         self,
@@ -852,7 +856,7 @@ class Mapper:
 
     def to_datahub_user(
         self, user: powerbi_data_classes.User
-    ) -> List[MetadataChangeProposalWrapper]:
+    ) -> Iterable[MetadataChangeProposalWrapper]:
         """
         Map PowerBi user to datahub user
         """
@@ -864,16 +868,14 @@ class Mapper:
             use_email=self.__config.ownership.use_powerbi_email,
             remove_email_suffix=self.__config.ownership.remove_email_suffix,
         )
-        user_urn = builder.make_user_urn(user_id)
+        user_urn = _make_user_urn_cached(user_id)
         user_key = CorpUserKeyClass(username=user.id)
 
-        user_key_mcp = self.new_mcp(
+        yield self.new_mcp(
             entity_urn=user_urn,
             aspect=user_key,
         )
 
-        return [user_key_mcp]
-
     def to_datahub_users(
         self, users: List[powerbi_data_classes.User]
     ) -> List[MetadataChangeProposalWrapper]: